@@ -0,0 +1,613 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+from PyQt5.QtWidgets import (
+    QApplication, QWidget, QLabel, QPushButton, QFileDialog,
+    QVBoxLayout, QHBoxLayout, QCheckBox, QMessageBox, QMenu,
+    QSystemTrayIcon, QDialog, QKeySequenceEdit, QDialogButtonBox, QShortcut
+)
+from PyQt5.QtGui import QPixmap, QPixmapCache, QIcon, QKeySequence, QScreen, QImage
+from PyQt5.QtCore import (
+    Qt, QSize, QEvent, QRect, QObject, QRunnable, QThreadPool,
+    QAbstractNativeEventFilter, pyqtSignal
+)
+import sys
+import ctypes
+
+
+# Constants
+DEFAULT_IMAGE: Path = Path("crosshair.png")
+TRAY_ICON: Path = Path("crosshair.ico")
+CROSSHAIR_SIZE: int = 100
+WINDOW_SIZE: Tuple[int, int] = (400, 280)
+HOTKEY: str = "Alt+S"
+# Bundled resources live in PyInstaller's temp dir when frozen, else next to the cwd
+RESOURCE_BASE: Path = Path(getattr(sys, '_MEIPASS', Path.cwd()))
+ENABLE_CHANGE_HOTKEY: bool = True  # False hides the Change Hotkey button
+
+# Window flags per mode; Qt.Window is included so they compare equal to windowFlags()
+# and setWindowFlags() can skip recreating the native window when nothing changes.
+# Settings mode adds WindowStaysOnTopHint when pinned.
+SETTINGS_FLAGS: Qt.WindowFlags = Qt.Window | Qt.FramelessWindowHint
+OVERLAY_FLAGS: Qt.WindowFlags = (
+    Qt.Window | Qt.FramelessWindowHint | Qt.Tool | Qt.WindowStaysOnTopHint
+)
+
+# Application style sheet, parsed once; modes switch by the window's object name
+APP_QSS: str = (
+    "#settingsRoot, #settingsRoot QWidget{background:#121212; color:white;}"
+    "#settingsRoot QPushButton#actionBtn{background:#2c2c2c; padding:8px; border-radius:6px;}"
+    "#settingsRoot QCheckBox{padding:6px;}"
+    "#overlayRoot, #overlayRoot QLabel{background:transparent;}"
+    "QMenu#trayMenu{background:#2c2c2c; color:white; font-size:13pt;}"
+    "QMenu#trayMenu::item{padding:10px 20px;}"
+    "QMenu#trayMenu::item:selected{background:#505050;}"
+)
+
+# Extended window styles for click-through
+GWL_EXSTYLE: int = -20
+WS_EX_TOPMOST: int = 0x00000008
+WS_EX_TRANSPARENT: int = 0x00000020
+WS_EX_TOOLWINDOW: int = 0x00000080
+WS_EX_LAYERED: int = 0x00080000
+WS_EX_NOACTIVATE: int = 0x08000000
+CLICK_THROUGH_STYLE: int = WS_EX_TRANSPARENT | WS_EX_LAYERED | WS_EX_NOACTIVATE
+# Full style of the overlay: Qt's translucent topmost tool window (already layered)
+OVERLAY_EX_STYLE: int = WS_EX_TOOLWINDOW | WS_EX_TOPMOST | WS_EX_LAYERED
+HWND_TOPMOST: int = -1
+HWND_NOTOPMOST: int = -2
+SWP_NOSIZE: int = 0x0001
+SWP_NOMOVE: int = 0x0002
+SWP_NOACTIVATE: int = 0x0010
+SWP_SHOWWINDOW: int = 0x0040
+TOPMOST_SWP_FLAGS: int = SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE | SWP_SHOWWINDOW
+Z_ORDER_SWP_FLAGS: int = SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE
+
+# Global hotkey (RegisterHotKey) values
+WM_HOTKEY: int = 0x0312
+HOTKEY_ID: int = 1
+MOD_ALT: int = 0x0001
+MOD_CONTROL: int = 0x0002
+MOD_SHIFT: int = 0x0004
+MOD_WIN: int = 0x0008
+MOD_NOREPEAT: int = 0x4000
+QT_TO_VK: dict = {
+    Qt.Key_Escape: 0x1B, Qt.Key_Tab: 0x09, Qt.Key_Backspace: 0x08,
+    Qt.Key_Return: 0x0D, Qt.Key_Enter: 0x0D, Qt.Key_Space: 0x20,
+    Qt.Key_PageUp: 0x21, Qt.Key_PageDown: 0x22, Qt.Key_End: 0x23, Qt.Key_Home: 0x24,
+    Qt.Key_Left: 0x25, Qt.Key_Up: 0x26, Qt.Key_Right: 0x27, Qt.Key_Down: 0x28,
+    Qt.Key_Insert: 0x2D, Qt.Key_Delete: 0x2E,
+}
+
+
+# user32 entry points, resolved once instead of through ctypes.windll per call
+if sys.platform == "win32":
+    from ctypes import wintypes
+
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    # 32-bit user32 only exports the *LongW names; the *LongPtrW ones are macros there
+    if hasattr(_user32, "GetWindowLongPtrW"):
+        _GetWindowLongPtrW = _user32.GetWindowLongPtrW
+        _SetWindowLongPtrW = _user32.SetWindowLongPtrW
+    else:
+        _GetWindowLongPtrW = _user32.GetWindowLongW
+        _SetWindowLongPtrW = _user32.SetWindowLongW
+    _GetWindowLongPtrW.argtypes = [wintypes.HWND, ctypes.c_int]
+    _GetWindowLongPtrW.restype = ctypes.c_ssize_t
+    _SetWindowLongPtrW.argtypes = [wintypes.HWND, ctypes.c_int, ctypes.c_ssize_t]
+    _SetWindowLongPtrW.restype = ctypes.c_ssize_t
+    _SetWindowPos = _user32.SetWindowPos
+    _SetWindowPos.argtypes = [wintypes.HWND, wintypes.HWND, ctypes.c_int, ctypes.c_int,
+                              ctypes.c_int, ctypes.c_int, wintypes.UINT]
+    _SetWindowPos.restype = wintypes.BOOL
+    _RegisterHotKey = _user32.RegisterHotKey
+    _RegisterHotKey.argtypes = [wintypes.HWND, ctypes.c_int, wintypes.UINT, wintypes.UINT]
+    _RegisterHotKey.restype = wintypes.BOOL
+    _UnregisterHotKey = _user32.UnregisterHotKey
+    _UnregisterHotKey.argtypes = [wintypes.HWND, ctypes.c_int]
+    _UnregisterHotKey.restype = wintypes.BOOL
+    _VkKeyScanW = _user32.VkKeyScanW
+    _VkKeyScanW.argtypes = [wintypes.WCHAR]
+    _VkKeyScanW.restype = ctypes.c_short
+
+    # DPI awareness (optional, can improve fullscreen behavior); shcore is Windows 8.1+
+    try:
+        _shcore = ctypes.WinDLL("shcore")
+    except OSError:
+        _shcore = None
+    if _shcore is not None:
+        _shcore.SetProcessDpiAwareness.argtypes = [ctypes.c_int]
+        _shcore.SetProcessDpiAwareness(2)
+
+
+def set_click_through_hwnd(hwnd: int) -> None:
+    style: int = _GetWindowLongPtrW(hwnd, GWL_EXSTYLE)
+    _SetWindowLongPtrW(hwnd, GWL_EXSTYLE, style | CLICK_THROUGH_STYLE)
+    _SetWindowPos(hwnd, HWND_TOPMOST, 0, 0, 0, 0, TOPMOST_SWP_FLAGS)
+
+
+def unset_click_through_hwnd(hwnd: int) -> None:
+    style: int = _GetWindowLongPtrW(hwnd, GWL_EXSTYLE)
+    _SetWindowLongPtrW(hwnd, GWL_EXSTYLE, style & ~WS_EX_TRANSPARENT & ~WS_EX_NOACTIVATE)
+
+
+def native_hotkey(seq: QKeySequence) -> Optional[Tuple[int, int]]:
+    """Translate the first chord of a QKeySequence into RegisterHotKey (mods, vk)."""
+    if seq.isEmpty():
+        return None
+    combo: int = seq[0]
+    key: int = combo & ~int(Qt.KeyboardModifierMask)
+    mods: int = MOD_NOREPEAT
+    if combo & Qt.AltModifier:
+        mods |= MOD_ALT
+    if combo & Qt.ControlModifier:
+        mods |= MOD_CONTROL
+    if combo & Qt.ShiftModifier:
+        mods |= MOD_SHIFT
+    if combo & Qt.MetaModifier:
+        mods |= MOD_WIN
+    if Qt.Key_A <= key <= Qt.Key_Z or Qt.Key_0 <= key <= Qt.Key_9:
+        vk: int = key
+    elif Qt.Key_F1 <= key <= Qt.Key_F24:
+        vk = 0x70 + key - Qt.Key_F1
+    elif key in QT_TO_VK:
+        vk = QT_TO_VK[key]
+    elif key < 0x10000:
+        vk = _VkKeyScanW(chr(key)) & 0xFF
+        if vk == 0xFF:
+            return None
+    else:
+        return None
+    return mods, vk
+
+
+@lru_cache(maxsize=None)
+def resource_path(relative_path: Path) -> Path:
+    return RESOURCE_BASE / relative_path
+
+
+def scale_crosshair(img: QImage) -> QImage:
+    """Fit an image into CROSSHAIR_SIZE; crosshair-sized images are returned as is."""
+    if max(img.width(), img.height()) == CROSSHAIR_SIZE:
+        return img
+    # Smooth even for small factors: nearest-neighbour can drop 1px crosshair lines
+    return img.scaled(CROSSHAIR_SIZE, CROSSHAIR_SIZE,
+                      Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+class ImageLoaderSignals(QObject):
+    loaded = pyqtSignal(object, QImage)
+
+
+class ImageLoader(QRunnable):
+    """Decodes and scales a crosshair on a pool thread; QImage, unlike QPixmap, allows that."""
+
+    def __init__(self, key: str, path: Path,
+                 signals: ImageLoaderSignals) -> None:
+        super().__init__()
+        self._key = key
+        self._path = path
+        self._signals = signals
+
+    def run(self) -> None:
+        img = QImage(str(self._path))
+        if not img.isNull():
+            img = scale_crosshair(img)
+        self._signals.loaded.emit(self._key, img)
+
+
+class HotkeyFilter(QAbstractNativeEventFilter):
+    """Catches WM_HOTKEY from the thread queue, whatever window Qt has recreated."""
+
+    def __init__(self, callback: Callable[[], None]) -> None:
+        super().__init__()
+        self._callback = callback
+
+    def nativeEventFilter(self, event_type, message):
+        if event_type == b"windows_generic_MSG":
+            msg = wintypes.MSG.from_address(int(message))
+            if msg.message == WM_HOTKEY and msg.wParam == HOTKEY_ID:
+                self._callback()
+                return True, 0
+        return False, 0
+
+
+class SingleChordEdit(QKeySequenceEdit):
+    """QKeySequenceEdit that stops at one chord, since a global hotkey is a single combo."""
+
+    def keyPressEvent(self, event) -> None:
+        super().keyPressEvent(event)
+        # keySequenceChanged only fires after the 1s recording timeout, so trim here
+        # to keep the field showing what will actually be registered
+        seq: QKeySequence = self.keySequence()
+        if seq.count() > 1:
+            self.setKeySequence(QKeySequence(seq[0]))
+
+
+class HotkeyDialog(QDialog):
+    def __init__(self, current_hotkey: str, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Change Hotkey")
+        self.setFixedSize(300, 100)
+        layout = QVBoxLayout(self)
+        self.label = QLabel(f"Current Hotkey: {current_hotkey}\nPress new hotkey:", self)
+        layout.addWidget(self.label)
+        self.edit = SingleChordEdit(self)
+        layout.addWidget(self.edit)
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel, self)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+        self.edit.setFocus()
+
+    @property
+    def key_sequence(self) -> Optional[QKeySequence]:
+        seq: QKeySequence = self.edit.keySequence()
+        return None if seq.isEmpty() else QKeySequence(seq[0])
+
+
+class CrosshairApp(QWidget):
+    def __init__(self) -> None:
+        super().__init__()
+        self.current_hotkey_seq: QKeySequence = QKeySequence(HOTKEY)
+        self.click_through: bool = True
+        self._click_through_applied: bool = False  # what the current HWND actually has
+        self._mode: Optional[str] = None
+        self._hotkey_registered: bool = False
+        self._hotkey_filter: Optional[HotkeyFilter] = None
+        self._hotkey_shortcut: Optional[QShortcut] = None
+        self._hwnd_cache: Optional[int] = None
+        self._screen_geom: Optional[QRect] = None
+        self._current_pix: QPixmap = QPixmap()
+        self._current_pix_size: QSize = QSize(CROSSHAIR_SIZE, CROSSHAIR_SIZE)
+        self._pending_load: Optional[str] = None
+        self._loader_signals = ImageLoaderSignals(self)
+        self._loader_signals.loaded.connect(self._on_image_loaded)
+        self._load_resources()
+        self._init_window()
+        self._init_ui()
+        self._init_screen()
+        self._init_tray()
+        if not self._init_hotkey():
+            self._warn_hotkey_unavailable(self.current_hotkey_seq)
+        self.load_image(self.default_image)
+        self.show_settings()
+
+    def _load_resources(self) -> None:
+        self.default_image: Path = resource_path(DEFAULT_IMAGE)
+        self.tray_icon_path: Path = resource_path(TRAY_ICON)
+        # The bundled default doesn't change during a session; scale it once so
+        # Reset never goes back to the filesystem
+        self._default_scaled: QPixmap = QPixmap(str(self.default_image)).scaled(
+            CROSSHAIR_SIZE, CROSSHAIR_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    def _init_window(self) -> None:
+        self.setWindowTitle("Custom Crosshair")
+        self.setWindowFlags(SETTINGS_FLAGS | Qt.WindowStaysOnTopHint)  # "Topmost" starts checked
+        self.setFixedSize(*WINDOW_SIZE)
+        self.setObjectName("settingsRoot")
+
+    def _init_ui(self) -> None:
+        self.image_label = QLabel(alignment=Qt.AlignCenter)
+        self.image_label.setFixedSize(CROSSHAIR_SIZE, CROSSHAIR_SIZE)
+        self.image_label.setAttribute(Qt.WA_TranslucentBackground, True)
+        # The pixmap carries its own alpha; nothing needs painting underneath it
+        self.image_label.setAttribute(Qt.WA_NoSystemBackground, True)
+
+        self.reset_btn = QPushButton("Reset")
+        self.select_btn = QPushButton("Select")
+        self.center_btn = QPushButton("Center")
+        self.pin_chk = QCheckBox("Topmost")
+        self.pin_chk.setChecked(True)
+        self.click_chk = QCheckBox("Click-Through")
+        self.click_chk.setChecked(True)
+
+        for w in (self.reset_btn, self.select_btn, self.center_btn):
+            w.setObjectName("actionBtn")
+
+        self.reset_btn.clicked.connect(self._on_reset)
+        self.select_btn.clicked.connect(self._on_select)
+        self.center_btn.clicked.connect(self._on_center)
+        self.pin_chk.stateChanged.connect(self._on_pin_toggle)
+        self.click_chk.stateChanged.connect(self._on_click_toggle)
+
+        self._chrome_widgets: Tuple[QWidget, ...] = (
+            self.reset_btn, self.select_btn, self.center_btn,
+            self.pin_chk, self.click_chk
+        )
+        if ENABLE_CHANGE_HOTKEY:
+            self.change_hotkey_btn = QPushButton("Change Hotkey")
+            self.change_hotkey_btn.setObjectName("actionBtn")
+            self.change_hotkey_btn.clicked.connect(self._on_change_hotkey_clicked)
+            self._chrome_widgets += (self.change_hotkey_btn,)
+        btn_layout = QVBoxLayout()
+        for w in self._chrome_widgets:
+            btn_layout.addWidget(w)
+
+        self.settings_layout = QHBoxLayout()
+        self.settings_layout.setContentsMargins(0, 0, 0, 0)
+        self.settings_layout.setSpacing(10)
+        self.settings_layout.addWidget(self.image_label)
+        self.settings_layout.addLayout(btn_layout)
+        self.setLayout(self.settings_layout)
+
+    def _init_screen(self) -> None:
+        self._watch_screen(QApplication.primaryScreen())
+        QApplication.instance().primaryScreenChanged.connect(self._watch_screen)
+
+    def _watch_screen(self, screen: QScreen) -> None:
+        screen.geometryChanged.connect(self._invalidate_screen_geom)
+        self._invalidate_screen_geom()
+
+    def _invalidate_screen_geom(self) -> None:
+        self._screen_geom = None
+
+    def _init_tray(self) -> None:
+        icon = QIcon(str(self.tray_icon_path))
+        self.tray = QSystemTrayIcon(icon, self)
+        # Actions are filled in on first right-click, not at startup
+        self.tray_menu = QMenu(self)
+        self.tray_menu.setObjectName("trayMenu")
+        self.tray_menu.aboutToShow.connect(self._populate_tray_menu)
+        self.tray.setContextMenu(self.tray_menu)
+        self.tray.show()
+        self.tray.activated.connect(self._on_tray_activated)
+
+    def _populate_tray_menu(self) -> None:
+        self.tray_menu.aboutToShow.disconnect(self._populate_tray_menu)
+        for text, fn in (("Show", self.show_overlay), ("Hide", self.hide),
+                         ("Settings", self.show_settings), ("Exit", QApplication.quit)):
+            self.tray_menu.addAction(text, fn)
+
+    def _on_tray_activated(self, reason: QSystemTrayIcon.ActivationReason) -> None:
+        if reason == QSystemTrayIcon.Trigger:
+            if self.isVisible():
+                self.hide()
+            else:
+                self.show_settings()
+
+    def _init_hotkey(self) -> bool:
+        if sys.platform != "win32":
+            # No RegisterHotKey here; a window shortcut at least works while focused
+            if self._hotkey_shortcut is None:
+                self._hotkey_shortcut = QShortcut(self.current_hotkey_seq, self,
+                                                  activated=self._toggle_visibility)
+            else:
+                self._hotkey_shortcut.setKey(self.current_hotkey_seq)
+            return True
+        if self._hotkey_filter is None:
+            self._hotkey_filter = HotkeyFilter(self._toggle_visibility)
+            QApplication.instance().installNativeEventFilter(self._hotkey_filter)
+            # Closing the window only sends the app to the tray; keep the hotkey until quit
+            QApplication.instance().aboutToQuit.connect(self._unregister_hotkey)
+        return self._register_hotkey()
+
+    def _register_hotkey(self) -> bool:
+        # Registered against the thread (NULL hwnd) rather than this window, so
+        # WM_HOTKEY keeps arriving while a game has focus and survives
+        # setWindowFlags() recreating the native window.
+        self._unregister_hotkey()
+        combo = native_hotkey(self.current_hotkey_seq)
+        if combo and _RegisterHotKey(None, HOTKEY_ID, *combo):
+            self._hotkey_registered = True
+        return self._hotkey_registered
+
+    def _warn_hotkey_unavailable(self, seq: QKeySequence) -> None:
+        # Keys with no VK mapping, combos owned by another app, and reserved ones like F12
+        QMessageBox.warning(self, "Hotkey Unavailable",
+                            f"Could not register {seq.toString()} as a global hotkey.\n"
+                            "It may be in use by another application or reserved by Windows.")
+
+    def _unregister_hotkey(self) -> None:
+        if self._hotkey_registered:
+            _UnregisterHotKey(None, HOTKEY_ID)
+            self._hotkey_registered = False
+
+    def _hwnd(self) -> int:
+        if self._hwnd_cache is None:
+            self._hwnd_cache = int(self.winId())
+        return self._hwnd_cache
+
+    def event(self, event: QEvent) -> bool:
+        # setWindowFlags() recreates the native window
+        if event.type() == QEvent.WinIdChange:
+            self._hwnd_cache = None
+            self._click_through_applied = False
+        return super().event(event)
+
+    def _toggle_visibility(self) -> None:
+        if self.isVisible():
+            self.hide()
+        else:
+            self.show_settings()
+
+    def _on_change_hotkey_clicked(self) -> None:
+        dlg = HotkeyDialog(self.current_hotkey_seq.toString(), self)
+        # A registered hotkey is swallowed before the dialog could record it
+        self._unregister_hotkey()
+        new_seq: Optional[QKeySequence] = None
+        if dlg.exec_() == QDialog.Accepted:
+            new_seq = dlg.key_sequence
+        old_seq: QKeySequence = self.current_hotkey_seq
+        if new_seq is not None and new_seq != old_seq:
+            self.current_hotkey_seq = new_seq
+            if self._init_hotkey():
+                QMessageBox.information(self, "Hotkey Changed",
+                                        f"New hotkey: {new_seq.toString()}")
+                return
+            self._warn_hotkey_unavailable(new_seq)
+            self.current_hotkey_seq = old_seq
+        # Cancelled, unchanged or rejected: put the previous hotkey back
+        if not self._init_hotkey():
+            self._warn_hotkey_unavailable(old_seq)
+
+    def _on_image_loaded(self, key: str, img: QImage) -> None:
+        # Results for anything but the latest pick are cached but not shown
+        current: bool = self._pending_load == key
+        if current:
+            self._pending_load = None
+        if img.isNull():
+            if current:
+                self._show_default()
+            return
+        pix = QPixmap.fromImage(img)
+        QPixmapCache.insert(key, pix)
+        if current:
+            self._set_pixmap(pix)
+
+    def load_image(self, path: Path) -> None:
+        # A newer pick supersedes any decode still running for an older one
+        self._pending_load = None
+        if path == self.default_image:
+            self._show_default()
+            return
+        # The single stat on this path keys the cache by mtime, so an edited PNG is
+        # decoded again; an unreadable file falls back to the default
+        try:
+            mtime: float = path.stat().st_mtime
+        except OSError:
+            self._show_default()
+            return
+        key = f"{path}@{mtime}@{CROSSHAIR_SIZE}"
+        cached: Optional[QPixmap] = QPixmapCache.find(key)
+        if cached is not None:
+            self._set_pixmap(cached)
+            return
+        # The label keeps the previous crosshair until the decode lands
+        self._pending_load = key
+        QThreadPool.globalInstance().start(ImageLoader(key, path, self._loader_signals))
+
+    def _show_default(self) -> None:
+        if self._default_scaled.isNull():
+            QMessageBox.warning(self, "Error", f"Cannot load: {self.default_image}")
+            return
+        self._set_pixmap(self._default_scaled)
+
+    def _set_pixmap(self, scaled_pix: QPixmap) -> None:
+        self._current_pix = scaled_pix
+        self._current_pix_size = scaled_pix.size()
+        self.image_label.setPixmap(scaled_pix)
+        self.image_label.setFixedSize(self._current_pix_size)
+        # A decode can land after Center was pressed; resize the overlay around it
+        if self._mode == "overlay":
+            self._fit_overlay()
+
+    def _on_reset(self) -> None:
+        self.load_image(self.default_image)
+        self.show_settings()
+
+    def _on_select(self) -> None:
+        f, _ = QFileDialog.getOpenFileName(self, "Select Image", filter="PNG (*.png)")
+        if f:
+            self.load_image(Path(f))
+
+    def _on_center(self) -> None:
+        self._enter_overlay()
+
+    def _on_pin_toggle(self) -> None:
+        pinned: bool = self.pin_chk.isChecked()
+        if sys.platform == "win32":
+            # Only move in the z-order; setWindowFlag() would recreate the window
+            _SetWindowPos(self._hwnd(), HWND_TOPMOST if pinned else HWND_NOTOPMOST,
+                          0, 0, 0, 0, Z_ORDER_SWP_FLAGS)
+        else:
+            self.setWindowFlags(self._settings_flags())
+            self.show()
+
+    def _on_click_toggle(self) -> None:
+        self.click_through = self.click_chk.isChecked()
+        if sys.platform != "win32" or self._click_through_applied == self.click_through:
+            return
+        if self.click_through:
+            set_click_through_hwnd(self._hwnd())
+        else:
+            unset_click_through_hwnd(self._hwnd())
+        self._click_through_applied = self.click_through
+
+    def _center(self) -> None:
+        if self._screen_geom is None:
+            self._screen_geom = QApplication.primaryScreen().geometry()
+        screen_geom = self._screen_geom
+        x = screen_geom.left() + (screen_geom.width() - self.width()) // 2
+        y = screen_geom.top() + (screen_geom.height() - self.height()) // 2
+        self.move(x, y)
+
+    def _settings_flags(self) -> Qt.WindowFlags:
+        if self.pin_chk.isChecked():
+            return SETTINGS_FLAGS | Qt.WindowStaysOnTopHint
+        return SETTINGS_FLAGS
+
+    def _set_root(self, name: str) -> None:
+        # Re-evaluates the already-parsed APP_QSS rules; the label is the only
+        # child visible in both modes
+        self.setObjectName(name)
+        for w in (self, self.image_label):
+            w.style().unpolish(w)
+            w.style().polish(w)
+
+    def _fit_overlay(self) -> None:
+        self.setFixedSize(self._current_pix_size)
+        self._center()
+        if self._current_pix.hasAlpha():
+            # Only the opaque part of the crosshair reaches the compositor
+            self.setMask(self._current_pix.mask())
+
+    def _enter_overlay(self) -> None:
+        if self._mode == "overlay":
+            self.show()
+            self.raise_()
+            return
+        self._mode = "overlay"
+        self.setUpdatesEnabled(False)
+        try:
+            for w in self._chrome_widgets:
+                w.hide()
+            # On Windows Qt flushes a translucent window with UpdateLayeredWindowIndirect,
+            # keeping WS_EX_LAYERED (and so click-through) across repaints
+            self.setAttribute(Qt.WA_TranslucentBackground, True)
+            self._set_root("overlayRoot")
+            self.setWindowFlags(OVERLAY_FLAGS)
+            self._fit_overlay()
+        finally:
+            self.setUpdatesEnabled(True)
+        self.show()
+        if sys.platform == "win32":
+            style: int = OVERLAY_EX_STYLE
+            if self.click_through:
+                style |= CLICK_THROUGH_STYLE
+            _SetWindowLongPtrW(self._hwnd(), GWL_EXSTYLE, style)
+            self._click_through_applied = self.click_through
+
+    def show_settings(self) -> None:
+        if self._mode == "settings":
+            self.show()
+            self.raise_()
+            return
+        self._mode = "settings"
+        self.setUpdatesEnabled(False)
+        try:
+            for w in self._chrome_widgets:
+                w.show()
+            self.setAttribute(Qt.WA_TranslucentBackground, False)
+            self.clearMask()
+            self._set_root("settingsRoot")
+            self.setWindowFlags(self._settings_flags())
+            self.setFixedSize(*WINDOW_SIZE)
+            self._center()
+        finally:
+            self.setUpdatesEnabled(True)
+        self.show()
+
+    def show_overlay(self) -> None:
+        self._enter_overlay()
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    # The app lives in the tray; hiding or closing the window must not end it
+    app.setQuitOnLastWindowClosed(False)
+    app.setStyleSheet(APP_QSS)
+    win = CrosshairApp()
+    win.show()
+    sys.exit(app.exec_())